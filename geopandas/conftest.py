@@ -1,5 +1,6 @@
 import pytest
 import geopandas
+from geopandas.datasets import get_path
 
 
 @pytest.fixture(autouse=True)
@@ -7,6 +8,11 @@ def add_geopandas(doctest_namespace):
     doctest_namespace["geopandas"] = geopandas
 
 
+@pytest.fixture(scope="session")
+def naturalearth_lowres():
+    return geopandas.read_file(get_path("naturalearth_lowres"))
+
+
 def pytest_configure(config):
     config.addinivalue_line(
         "markers",
@@ -1,5 +1,5 @@
 from distutils.version import LooseVersion
-import itertools
+import functools
 import warnings
 
 import numpy as np
@@ -19,7 +19,7 @@ from shapely.geometry import (
 )
 
 
-from geopandas import GeoDataFrame, GeoSeries, read_file
+from geopandas import GeoDataFrame, GeoSeries, points_from_xy, read_file
 from geopandas.datasets import get_path
 import geopandas._compat as compat
 from geopandas.plotting import GeoplotAccessor
@@ -30,6 +30,11 @@ matplotlib = pytest.importorskip("matplotlib")
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt  # noqa
 
+# matplotlib >= 1.5 is the minimum supported version for these tests
+pytestmark = pytest.mark.skipif(
+    matplotlib.__version__ < LooseVersion("1.5.0"), reason="matplotlib >= 1.5 required"
+)
+
 try:  # skipif and importorskip do not work for decorators
     from matplotlib.testing.decorators import check_figures_equal
 
@@ -44,41 +49,54 @@ except ImportError:
 
 @pytest.fixture(autouse=True)
 def close_figures(request):
+    # only close the figures created by the test itself
+    existing = set(plt.get_fignums())
     yield
-    plt.close("all")
+    for num in set(plt.get_fignums()) - existing:
+        plt.close(num)
 
 
-try:
-    cycle = matplotlib.rcParams["axes.prop_cycle"].by_key()
-    MPL_DFT_COLOR = cycle["color"][0]
-except KeyError:
-    MPL_DFT_COLOR = matplotlib.rcParams["axes.color_cycle"][0]
+# default color as RGBA tuple, so it is parsed only once
+MPL_DFT_COLOR = matplotlib.colors.colorConverter.to_rgba(
+    matplotlib.rcParams["axes.prop_cycle"].by_key()["color"][0]
+)
 
 plt.rcParams.update({"figure.max_open_warning": 0})
 
 
-class TestPointPlotting:
-    def setup_method(self):
-        self.N = 10
-        self.points = GeoSeries(Point(i, i) for i in range(self.N))
+N_POINTS = 10
 
-        values = np.arange(self.N)
 
-        self.df = GeoDataFrame({"geometry": self.points, "values": values})
-        self.df["exp"] = (values * 10) ** 3
+class TestPointPlotting:
+    @classmethod
+    def setup_class(cls):
+        cls.N = N_POINTS
+        coords = np.arange(cls.N)
+        cls.points = GeoSeries(points_from_xy(coords, coords))
 
-        multipoint1 = MultiPoint(self.points)
+        multipoint1 = MultiPoint(cls.points)
         multipoint2 = rotate(multipoint1, 90)
-        self.df2 = GeoDataFrame(
+        cls.df2 = GeoDataFrame(
             {"geometry": [multipoint1, multipoint2], "values": [0, 1]}
         )
 
-    def test_figsize(self):
+        cls.expected_linear = _cmap()(np.arange(cls.N) / (cls.N - 1))
+        cls.expected_rdylgn = _cmap("RdYlGn")(np.arange(cls.N) / (cls.N - 1))
+        cls.expected_set1 = _cmap("Set1", lut=5)(list(range(5)) * 2)
 
-        ax = self.points.plot(figsize=(1, 1))
-        np.testing.assert_array_equal(ax.figure.get_size_inches(), (1, 1))
+    def setup_method(self):
+        # some tests add columns to self.df, so it is created for every test
+        values = np.arange(self.N)
+
+        self.df = GeoDataFrame({"geometry": self.points, "values": values})
+        self.df["exp"] = (values * 10) ** 3
 
-        ax = self.df.plot(figsize=(1, 1))
+        self.data = {"series": self.points, "frame": self.df}
+
+    @pytest.mark.parametrize("kind", ["series", "frame"])
+    def test_figsize(self, kind):
+
+        ax = self.data[kind].plot(figsize=(1, 1))
         np.testing.assert_array_equal(ax.figure.get_size_inches(), (1, 1))
 
     def test_default_colors(self):
@@ -99,9 +117,7 @@ class TestPointPlotting:
 
         # # with specifying values -> different colors for all 10 values
         ax = self.df.plot(column="values")
-        cmap = plt.get_cmap()
-        expected_colors = cmap(np.arange(self.N) / (self.N - 1))
-        _check_colors(self.N, ax.collections[0].get_facecolors(), expected_colors)
+        _check_colors(self.N, ax.collections[0].get_facecolors(), self.expected_linear)
 
     def test_series_color_no_index(self):
 
@@ -147,8 +163,7 @@ class TestPointPlotting:
 
         # GeoSeries
         ax = self.points.plot(cmap="RdYlGn")
-        cmap = plt.get_cmap("RdYlGn")
-        exp_colors = cmap(np.arange(self.N) / (self.N - 1))
+        exp_colors = self.expected_rdylgn
         _check_colors(self.N, ax.collections[0].get_facecolors(), exp_colors)
 
         ax = self.df.plot(cmap="RdYlGn")
@@ -156,36 +171,34 @@ class TestPointPlotting:
 
         # # with specifying values -> different colors for all 10 values
         ax = self.df.plot(column="values", cmap="RdYlGn")
-        cmap = plt.get_cmap("RdYlGn")
         _check_colors(self.N, ax.collections[0].get_facecolors(), exp_colors)
 
         # when using a cmap with specified lut -> limited number of different
         # colors
-        ax = self.points.plot(cmap=plt.get_cmap("Set1", lut=5))
-        cmap = plt.get_cmap("Set1", lut=5)
-        exp_colors = cmap(list(range(5)) * 2)
+        ax = self.points.plot(cmap=_cmap("Set1", lut=5))
+        exp_colors = self.expected_set1
         _check_colors(self.N, ax.collections[0].get_facecolors(), exp_colors)
 
-    def test_single_color(self):
+    @pytest.mark.parametrize("kind", ["series", "frame"])
+    def test_single_color(self, kind):
+        data = self.data[kind]
 
-        ax = self.points.plot(color="green")
-        _check_colors(self.N, ax.collections[0].get_facecolors(), ["green"] * self.N)
-
-        ax = self.df.plot(color="green")
+        ax = data.plot(color="green")
         _check_colors(self.N, ax.collections[0].get_facecolors(), ["green"] * self.N)
 
         # check rgba tuple GH1178
-        ax = self.df.plot(color=(0.5, 0.5, 0.5))
+        ax = data.plot(color=(0.5, 0.5, 0.5))
         _check_colors(
             self.N, ax.collections[0].get_facecolors(), [(0.5, 0.5, 0.5)] * self.N
         )
-        ax = self.df.plot(color=(0.5, 0.5, 0.5, 0.5))
+        ax = data.plot(color=(0.5, 0.5, 0.5, 0.5))
         _check_colors(
             self.N, ax.collections[0].get_facecolors(), [(0.5, 0.5, 0.5, 0.5)] * self.N
         )
         with pytest.raises((ValueError, TypeError)):
-            self.df.plot(color="not color")
+            data.plot(color="not color")
 
+    def test_single_color_column(self):
         with warnings.catch_warnings(record=True) as _:  # don't print warning
             # 'color' overrides 'column'
             ax = self.df.plot(column="values", color="green")
@@ -341,7 +354,7 @@ class TestPointPlotting:
         _check_colors(4, ax.collections[0].get_facecolors(), [MPL_DFT_COLOR] * 4)
 
         ax = self.df2.plot(column="values")
-        cmap = plt.get_cmap(lut=2)
+        cmap = _cmap(lut=2)
         expected_colors = [cmap(0)] * self.N + [cmap(1)] * self.N
         _check_colors(20, ax.collections[0].get_facecolors(), expected_colors)
 
@@ -407,12 +420,12 @@ class TestPointPlotting:
     def test_misssing(self):
         self.df.loc[0, "values"] = np.nan
         ax = self.df.plot("values")
-        cmap = plt.get_cmap()
+        cmap = _cmap()
         expected_colors = cmap(np.arange(self.N - 1) / (self.N - 2))
         _check_colors(self.N - 1, ax.collections[0].get_facecolors(), expected_colors)
 
         ax = self.df.plot("values", missing_kwds={"color": "r"})
-        cmap = plt.get_cmap()
+        cmap = _cmap()
         expected_colors = cmap(np.arange(self.N - 1) / (self.N - 2))
         _check_colors(1, ax.collections[1].get_facecolors(), ["r"])
         _check_colors(self.N - 1, ax.collections[0].get_facecolors(), expected_colors)
@@ -430,11 +443,13 @@ class TestPointPlotting:
 
 
 class TestPointZPlotting:
-    def setup_method(self):
-        self.N = 10
-        self.points = GeoSeries(Point(i, i, i) for i in range(self.N))
-        values = np.arange(self.N)
-        self.df = GeoDataFrame({"geometry": self.points, "values": values})
+    @classmethod
+    def setup_class(cls):
+        cls.N = N_POINTS
+        coords = np.arange(cls.N)
+        cls.points = GeoSeries(points_from_xy(coords, coords, coords))
+        values = np.arange(cls.N)
+        cls.df = GeoDataFrame({"geometry": cls.points, "values": values})
 
     def test_plot(self):
         # basic test that points with z coords don't break plotting
@@ -463,80 +478,91 @@ class TestLineStringPlotting:
         )
         self.df3 = GeoDataFrame({"geometry": self.linearrings, "values": values})
 
-    def test_single_color(self):
-
-        ax = self.lines.plot(color="green")
-        _check_colors(self.N, ax.collections[0].get_colors(), ["green"] * self.N)
-
-        ax = self.df.plot(color="green")
-        _check_colors(self.N, ax.collections[0].get_colors(), ["green"] * self.N)
+        self.data = {
+            "series": self.lines,
+            "frame": self.df,
+            "linearrings_series": self.linearrings,
+            "linearrings_frame": self.df3,
+        }
 
-        ax = self.linearrings.plot(color="green")
-        _check_colors(self.N, ax.collections[0].get_colors(), ["green"] * self.N)
+    @pytest.mark.parametrize(
+        "kind", ["series", "frame", "linearrings_series", "linearrings_frame"]
+    )
+    def test_single_color(self, kind):
+        data = self.data[kind]
 
-        ax = self.df3.plot(color="green")
+        ax = data.plot(color="green")
         _check_colors(self.N, ax.collections[0].get_colors(), ["green"] * self.N)
 
         # check rgba tuple GH1178
-        ax = self.df.plot(color=(0.5, 0.5, 0.5, 0.5))
-        _check_colors(
-            self.N, ax.collections[0].get_colors(), [(0.5, 0.5, 0.5, 0.5)] * self.N
-        )
-        ax = self.df.plot(color=(0.5, 0.5, 0.5, 0.5))
+        ax = data.plot(color=(0.5, 0.5, 0.5, 0.5))
         _check_colors(
             self.N, ax.collections[0].get_colors(), [(0.5, 0.5, 0.5, 0.5)] * self.N
         )
         with pytest.raises((TypeError, ValueError)):
-            self.df.plot(color="not color")
+            data.plot(color="not color")
 
+    def test_single_color_column(self):
         with warnings.catch_warnings(record=True) as _:  # don't print warning
             # 'color' overrides 'column'
             ax = self.df.plot(column="values", color="green")
             _check_colors(self.N, ax.collections[0].get_colors(), ["green"] * self.N)
 
-    def test_style_kwargs_linestyle(self):
+    @pytest.mark.parametrize("kind", ["series", "frame"])
+    def test_style_kwargs_linestyle(self, kind):
+        data = self.data[kind]
+
         # single
-        for ax in [
-            self.lines.plot(linestyle=":", linewidth=1),
-            self.df.plot(linestyle=":", linewidth=1),
-            self.df.plot(column="values", linestyle=":", linewidth=1),
-        ]:
-            assert [(0.0, [1.0, 1.65])] == ax.collections[0].get_linestyle()
+        ax = data.plot(linestyle=":", linewidth=1)
+        assert [(0.0, [1.0, 1.65])] == ax.collections[0].get_linestyle()
 
         # tuple
-        ax = self.lines.plot(linestyle=(0, (3, 10, 1, 15)), linewidth=1)
+        ax = data.plot(linestyle=(0, (3, 10, 1, 15)), linewidth=1)
         assert [(0, [3, 10, 1, 15])] == ax.collections[0].get_linestyle()
 
         # multiple
         ls = [("dashed", "dotted", "dashdot", "solid")[k % 4] for k in range(self.N)]
         exp_ls = [_style_to_linestring_onoffseq(st, 1) for st in ls]
         for ax in [
-            self.lines.plot(linestyle=ls, linewidth=1),
-            self.lines.plot(linestyles=ls, linewidth=1),
-            self.df.plot(linestyle=ls, linewidth=1),
-            self.df.plot(column="values", linestyle=ls, linewidth=1),
+            data.plot(linestyle=ls, linewidth=1),
+            data.plot(linestyles=ls, linewidth=1),
         ]:
             assert exp_ls == ax.collections[0].get_linestyle()
 
-    def test_style_kwargs_linewidth(self):
+    def test_style_kwargs_linestyle_column(self):
         # single
-        for ax in [
-            self.lines.plot(linewidth=2),
-            self.df.plot(linewidth=2),
-            self.df.plot(column="values", linewidth=2),
-        ]:
-            np.testing.assert_array_equal([2], ax.collections[0].get_linewidths())
+        ax = self.df.plot(column="values", linestyle=":", linewidth=1)
+        assert [(0.0, [1.0, 1.65])] == ax.collections[0].get_linestyle()
+
+        # multiple
+        ls = [("dashed", "dotted", "dashdot", "solid")[k % 4] for k in range(self.N)]
+        exp_ls = [_style_to_linestring_onoffseq(st, 1) for st in ls]
+        ax = self.df.plot(column="values", linestyle=ls, linewidth=1)
+        assert exp_ls == ax.collections[0].get_linestyle()
+
+    @pytest.mark.parametrize("kind", ["series", "frame"])
+    def test_style_kwargs_linewidth(self, kind):
+        data = self.data[kind]
+
+        # single
+        ax = data.plot(linewidth=2)
+        np.testing.assert_array_equal([2], ax.collections[0].get_linewidths())
 
         # multiple
         lw = [(0, 1, 2, 5.5, 10)[k % 5] for k in range(self.N)]
-        for ax in [
-            self.lines.plot(linewidth=lw),
-            self.lines.plot(linewidths=lw),
-            self.df.plot(linewidth=lw),
-            self.df.plot(column="values", linewidth=lw),
-        ]:
+        for ax in [data.plot(linewidth=lw), data.plot(linewidths=lw)]:
             np.testing.assert_array_equal(lw, ax.collections[0].get_linewidths())
 
+    def test_style_kwargs_linewidth_column(self):
+        # single
+        ax = self.df.plot(column="values", linewidth=2)
+        np.testing.assert_array_equal([2], ax.collections[0].get_linewidths())
+
+        # multiple
+        lw = [(0, 1, 2, 5.5, 10)[k % 5] for k in range(self.N)]
+        ax = self.df.plot(column="values", linewidth=lw)
+        np.testing.assert_array_equal(lw, ax.collections[0].get_linewidths())
+
     def test_style_kwargs_alpha(self):
         ax = self.df.plot(alpha=0.7)
         np.testing.assert_array_equal([0.7], ax.collections[0].get_alpha())
@@ -581,7 +607,7 @@ class TestLineStringPlotting:
         _check_colors(4, ax.collections[0].get_edgecolors(), [MPL_DFT_COLOR] * 4)
 
         ax = self.df2.plot("values")
-        cmap = plt.get_cmap(lut=2)
+        cmap = _cmap(lut=2)
         # colors are repeated for all components within a MultiLineString
         expected_colors = [cmap(0), cmap(0), cmap(1), cmap(1)]
         _check_colors(4, ax.collections[0].get_edgecolors(), expected_colors)
@@ -592,42 +618,42 @@ class TestLineStringPlotting:
 
 
 class TestPolygonPlotting:
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
 
         t1 = Polygon([(0, 0), (1, 0), (1, 1)])
         t2 = Polygon([(1, 0), (2, 0), (2, 1)])
-        self.polys = GeoSeries([t1, t2], index=list("AB"))
-        self.df = GeoDataFrame({"geometry": self.polys, "values": [0, 1]})
+        cls.polys = GeoSeries([t1, t2], index=list("AB"))
+        cls.df = GeoDataFrame({"geometry": cls.polys, "values": [0, 1]})
 
         multipoly1 = MultiPolygon([t1, t2])
         multipoly2 = rotate(multipoly1, 180)
-        self.df2 = GeoDataFrame(
-            {"geometry": [multipoly1, multipoly2], "values": [0, 1]}
-        )
+        cls.df2 = GeoDataFrame({"geometry": [multipoly1, multipoly2], "values": [0, 1]})
 
         t3 = Polygon([(2, 0), (3, 0), (3, 1)])
         df_nan = GeoDataFrame({"geometry": t3, "values": [np.nan]})
-        self.df3 = self.df.append(df_nan)
+        cls.df3 = cls.df.append(df_nan)
 
-    def test_single_color(self):
+        cls.data = {"series": cls.polys, "frame": cls.df}
 
-        ax = self.polys.plot(color="green")
-        _check_colors(2, ax.collections[0].get_facecolors(), ["green"] * 2)
-        # color only sets facecolor
-        assert len(ax.collections[0].get_edgecolors()) == 0
+    @pytest.mark.parametrize("kind", ["series", "frame"])
+    def test_single_color(self, kind):
+        data = self.data[kind]
 
-        ax = self.df.plot(color="green")
+        ax = data.plot(color="green")
         _check_colors(2, ax.collections[0].get_facecolors(), ["green"] * 2)
+        # color only sets facecolor
         assert len(ax.collections[0].get_edgecolors()) == 0
 
         # check rgba tuple GH1178
-        ax = self.df.plot(color=(0.5, 0.5, 0.5))
+        ax = data.plot(color=(0.5, 0.5, 0.5))
         _check_colors(2, ax.collections[0].get_facecolors(), [(0.5, 0.5, 0.5)] * 2)
-        ax = self.df.plot(color=(0.5, 0.5, 0.5, 0.5))
+        ax = data.plot(color=(0.5, 0.5, 0.5, 0.5))
         _check_colors(2, ax.collections[0].get_facecolors(), [(0.5, 0.5, 0.5, 0.5)] * 2)
         with pytest.raises((TypeError, ValueError)):
-            self.df.plot(color="not color")
+            data.plot(color="not color")
 
+    def test_single_color_column(self):
         with warnings.catch_warnings(record=True) as _:  # don't print warning
             # 'color' overrides 'values'
             ax = self.df.plot(column="values", color="green")
@@ -678,6 +704,11 @@ class TestPolygonPlotting:
         _check_colors(2, ax.collections[0].get_facecolors(), ["g"] * 2, alpha=0.4)
         _check_colors(2, ax.collections[0].get_edgecolors(), ["r"] * 2, alpha=0.4)
 
+        # alpha is applied to the colormap colors
+        ax = self.df.plot("values", alpha=0.4)
+        exp_colors = _cmap()([0.0, 1.0])
+        _check_colors(2, ax.collections[0].get_facecolors(), exp_colors, alpha=0.4)
+
         # check rgba tuple GH1178 for face and edge
         ax = self.df.plot(facecolor=(0.5, 0.5, 0.5), edgecolor=(0.4, 0.5, 0.6))
         _check_colors(2, ax.collections[0].get_facecolors(), [(0.5, 0.5, 0.5)] * 2)
@@ -689,37 +720,43 @@ class TestPolygonPlotting:
         _check_colors(2, ax.collections[0].get_facecolors(), [(0.5, 0.5, 0.5, 0.5)] * 2)
         _check_colors(2, ax.collections[0].get_edgecolors(), [(0.4, 0.5, 0.6, 0.5)] * 2)
 
-    def test_style_kwargs_linestyle(self):
+    @pytest.mark.parametrize("kind", ["series", "frame"])
+    def test_style_kwargs_linestyle(self, kind):
+        data = self.data[kind]
+
         #   single
-        ax = self.df.plot(linestyle=":", linewidth=1)
+        ax = data.plot(linestyle=":", linewidth=1)
         assert [(0.0, [1.0, 1.65])] == ax.collections[0].get_linestyle()
 
         # tuple
-        ax = self.df.plot(linestyle=(0, (3, 10, 1, 15)), linewidth=1)
+        ax = data.plot(linestyle=(0, (3, 10, 1, 15)), linewidth=1)
         assert [(0, [3, 10, 1, 15])] == ax.collections[0].get_linestyle()
 
         #   multiple
         ls = ["dashed", "dotted"]
         exp_ls = [_style_to_linestring_onoffseq(st, 1) for st in ls]
         for ax in [
-            self.df.plot(linestyle=ls, linewidth=1),
-            self.df.plot(linestyles=ls, linewidth=1),
+            data.plot(linestyle=ls, linewidth=1),
+            data.plot(linestyles=ls, linewidth=1),
         ]:
             assert exp_ls == ax.collections[0].get_linestyle()
 
-    def test_style_kwargs_linewidth(self):
+    @pytest.mark.parametrize("kind", ["series", "frame"])
+    def test_style_kwargs_linewidth(self, kind):
+        data = self.data[kind]
+
         #   single
-        ax = self.df.plot(linewidth=2)
+        ax = data.plot(linewidth=2)
         np.testing.assert_array_equal([2], ax.collections[0].get_linewidths())
         #   multiple
-        for ax in [self.df.plot(linewidth=[2, 4]), self.df.plot(linewidths=[2, 4])]:
+        for ax in [data.plot(linewidth=[2, 4]), data.plot(linewidths=[2, 4])]:
             np.testing.assert_array_equal([2, 4], ax.collections[0].get_linewidths())
 
         # alpha
-        ax = self.df.plot(alpha=0.7)
+        ax = data.plot(alpha=0.7)
         np.testing.assert_array_equal([0.7], ax.collections[0].get_alpha())
         try:
-            ax = self.df.plot(alpha=[0.7, 0.2])
+            ax = data.plot(alpha=[0.7, 0.2])
         except TypeError:
             # no list allowed for alpha up to matplotlib 3.3
             pass
@@ -781,7 +818,7 @@ class TestPolygonPlotting:
         _check_colors(4, ax.collections[0].get_facecolors(), [MPL_DFT_COLOR] * 4)
 
         ax = self.df2.plot("values")
-        cmap = plt.get_cmap(lut=2)
+        cmap = _cmap(lut=2)
         # colors are repeated for all components within a MultiPolygon
         expected_colors = [cmap(0), cmap(0), cmap(1), cmap(1)]
         _check_colors(4, ax.collections[0].get_facecolors(), expected_colors)
@@ -847,18 +884,17 @@ class TestPolygonPlotting:
 
 
 class TestPolygonZPlotting:
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
 
         t1 = Polygon([(0, 0, 0), (1, 0, 0), (1, 1, 1)])
         t2 = Polygon([(1, 0, 0), (2, 0, 0), (2, 1, 1)])
-        self.polys = GeoSeries([t1, t2], index=list("AB"))
-        self.df = GeoDataFrame({"geometry": self.polys, "values": [0, 1]})
+        cls.polys = GeoSeries([t1, t2], index=list("AB"))
+        cls.df = GeoDataFrame({"geometry": cls.polys, "values": [0, 1]})
 
         multipoly1 = MultiPolygon([t1, t2])
         multipoly2 = rotate(multipoly1, 180)
-        self.df2 = GeoDataFrame(
-            {"geometry": [multipoly1, multipoly2], "values": [0, 1]}
-        )
+        cls.df2 = GeoDataFrame({"geometry": [multipoly1, multipoly2], "values": [0, 1]})
 
     def test_plot(self):
         # basic test that points with z coords don't break plotting
@@ -893,7 +929,7 @@ class TestGeometryCollectionPlotting:
 
     def test_values(self):
         ax = self.df.plot("values")
-        cmap = plt.get_cmap()
+        cmap = _cmap()
         exp_colors = cmap([0.0, 1.0])
         _check_colors(2, ax.collections[0].get_facecolors(), exp_colors)  # poly
         _check_colors(
@@ -904,8 +940,6 @@ class TestGeometryCollectionPlotting:
 
 class TestNonuniformGeometryPlotting:
     def setup_method(self):
-        pytest.importorskip("matplotlib", "1.5.0")
-
         poly = Polygon([(1, 0), (2, 0), (2, 1)])
         line = LineString([(0.5, 0.5), (1, 1), (1, 0.5), (1.5, 1)])
         point = Point(0.75, 0.25)
@@ -921,7 +955,7 @@ class TestNonuniformGeometryPlotting:
 
         # colormap: different colors
         ax = self.series.plot(cmap="RdYlGn")
-        cmap = plt.get_cmap("RdYlGn")
+        cmap = _cmap("RdYlGn")
         exp_colors = cmap(np.arange(3) / (3 - 1))
         _check_colors(1, ax.collections[0].get_facecolors(), [exp_colors[0]])
         _check_colors(1, ax.collections[1].get_edgecolors(), [exp_colors[1]])
@@ -994,92 +1028,103 @@ class TestNonuniformGeometryPlotting:
         #     )
 
 
+@pytest.fixture(scope="module")
+def north_america(naturalearth_lowres):
+    df = naturalearth_lowres.copy()
+    return df.loc[df.continent == "North America"]
+
+
+@pytest.fixture(scope="module")
+def north_america_proj(north_america):
+    return north_america.to_crs("ESRI:102008")
+
+
+@pytest.fixture(scope="module")
+def north_america_aspect(north_america):
+    bounds = north_america.total_bounds
+    y_coord = np.mean([bounds[1], bounds[3]])
+    return 1 / np.cos(y_coord * np.pi / 180)
+
+
 class TestGeographicAspect:
-    def setup_class(self):
-        pth = get_path("naturalearth_lowres")
-        df = read_file(pth)
-        self.north = df.loc[df.continent == "North America"]
-        self.north_proj = self.north.to_crs("ESRI:102008")
-        bounds = self.north.total_bounds
-        y_coord = np.mean([bounds[1], bounds[3]])
-        self.exp = 1 / np.cos(y_coord * np.pi / 180)
-
-    def test_auto(self):
-        ax = self.north.geometry.plot()
-        assert ax.get_aspect() == self.exp
-        ax2 = self.north_proj.geometry.plot()
+    def test_auto(self, north_america, north_america_proj, north_america_aspect):
+        ax = north_america.geometry.plot()
+        assert ax.get_aspect() == north_america_aspect
+        ax2 = north_america_proj.geometry.plot()
         assert ax2.get_aspect() in ["equal", 1.0]
-        ax = self.north.plot()
-        assert ax.get_aspect() == self.exp
-        ax2 = self.north_proj.plot()
+        ax = north_america.plot()
+        assert ax.get_aspect() == north_america_aspect
+        ax2 = north_america_proj.plot()
         assert ax2.get_aspect() in ["equal", 1.0]
-        ax3 = self.north.plot("pop_est")
-        assert ax3.get_aspect() == self.exp
-        ax4 = self.north_proj.plot("pop_est")
+        ax3 = north_america.plot("pop_est")
+        assert ax3.get_aspect() == north_america_aspect
+        ax4 = north_america_proj.plot("pop_est")
         assert ax4.get_aspect() in ["equal", 1.0]
 
-    def test_manual(self):
-        ax = self.north.geometry.plot(aspect="equal")
+    def test_manual(self, north_america, north_america_proj):
+        ax = north_america.geometry.plot(aspect="equal")
         assert ax.get_aspect() in ["equal", 1.0]
-        self.north.geometry.plot(ax=ax, aspect=None)
+        north_america.geometry.plot(ax=ax, aspect=None)
         assert ax.get_aspect() in ["equal", 1.0]
-        ax2 = self.north.geometry.plot(aspect=0.5)
+        ax2 = north_america.geometry.plot(aspect=0.5)
         assert ax2.get_aspect() == 0.5
-        self.north.geometry.plot(ax=ax2, aspect=None)
+        north_america.geometry.plot(ax=ax2, aspect=None)
         assert ax2.get_aspect() == 0.5
-        ax3 = self.north_proj.geometry.plot(aspect=0.5)
+        ax3 = north_america_proj.geometry.plot(aspect=0.5)
         assert ax3.get_aspect() == 0.5
-        self.north_proj.geometry.plot(ax=ax3, aspect=None)
+        north_america_proj.geometry.plot(ax=ax3, aspect=None)
         assert ax3.get_aspect() == 0.5
-        ax = self.north.plot(aspect="equal")
+        ax = north_america.plot(aspect="equal")
         assert ax.get_aspect() in ["equal", 1.0]
-        self.north.plot(ax=ax, aspect=None)
+        north_america.plot(ax=ax, aspect=None)
         assert ax.get_aspect() in ["equal", 1.0]
-        ax2 = self.north.plot(aspect=0.5)
+        ax2 = north_america.plot(aspect=0.5)
         assert ax2.get_aspect() == 0.5
-        self.north.plot(ax=ax2, aspect=None)
+        north_america.plot(ax=ax2, aspect=None)
         assert ax2.get_aspect() == 0.5
-        ax3 = self.north_proj.plot(aspect=0.5)
+        ax3 = north_america_proj.plot(aspect=0.5)
         assert ax3.get_aspect() == 0.5
-        self.north_proj.plot(ax=ax3, aspect=None)
+        north_america_proj.plot(ax=ax3, aspect=None)
         assert ax3.get_aspect() == 0.5
-        ax = self.north.plot("pop_est", aspect="equal")
+        ax = north_america.plot("pop_est", aspect="equal")
         assert ax.get_aspect() in ["equal", 1.0]
-        self.north.plot("pop_est", ax=ax, aspect=None)
+        north_america.plot("pop_est", ax=ax, aspect=None)
         assert ax.get_aspect() in ["equal", 1.0]
-        ax2 = self.north.plot("pop_est", aspect=0.5)
+        ax2 = north_america.plot("pop_est", aspect=0.5)
         assert ax2.get_aspect() == 0.5
-        self.north.plot("pop_est", ax=ax2, aspect=None)
+        north_america.plot("pop_est", ax=ax2, aspect=None)
         assert ax2.get_aspect() == 0.5
-        ax3 = self.north_proj.plot("pop_est", aspect=0.5)
+        ax3 = north_america_proj.plot("pop_est", aspect=0.5)
         assert ax3.get_aspect() == 0.5
-        self.north_proj.plot("pop_est", ax=ax3, aspect=None)
+        north_america_proj.plot("pop_est", ax=ax3, aspect=None)
         assert ax3.get_aspect() == 0.5
 
 
-class TestMapclassifyPlotting:
-    @classmethod
-    def setup_class(cls):
-        try:
-            import mapclassify  # noqa
-        except ImportError:
-            pytest.importorskip("mapclassify")
-        cls.classifiers = list(mapclassify.classifiers.CLASSIFIERS)
-        cls.classifiers.remove("UserDefined")
-        pth = get_path("naturalearth_lowres")
-        cls.df = read_file(pth)
-        cls.df["NEGATIVES"] = np.linspace(-10, 10, len(cls.df.index))
-        cls.df["low_vals"] = np.linspace(0, 0.3, cls.df.shape[0])
-        cls.df["mid_vals"] = np.linspace(0.3, 0.7, cls.df.shape[0])
-        cls.df["high_vals"] = np.linspace(0.7, 1.0, cls.df.shape[0])
-        cls.df.loc[cls.df.index[:20:2], "high_vals"] = np.nan
-        cls.nybb = read_file(get_path("nybb"))
-        cls.nybb["vals"] = [0.001, 0.002, 0.003, 0.004, 0.005]
+@pytest.fixture(scope="module")
+def mapclassify_df(naturalearth_lowres):
+    pytest.importorskip("mapclassify")
+    df = naturalearth_lowres.copy()
+    df["NEGATIVES"] = np.linspace(-10, 10, len(df.index))
+    df["low_vals"] = np.linspace(0, 0.3, df.shape[0])
+    df["mid_vals"] = np.linspace(0.3, 0.7, df.shape[0])
+    df["high_vals"] = np.linspace(0.7, 1.0, df.shape[0])
+    df.loc[df.index[:20:2], "high_vals"] = np.nan
+    return df
 
-    def test_legend(self):
+
+@pytest.fixture(scope="module")
+def mapclassify_nybb():
+    pytest.importorskip("mapclassify")
+    nybb = read_file(get_path("nybb"))
+    nybb["vals"] = [0.001, 0.002, 0.003, 0.004, 0.005]
+    return nybb
+
+
+class TestMapclassifyPlotting:
+    def test_legend(self, mapclassify_df):
         with warnings.catch_warnings(record=True) as _:  # don't print warning
             # warning coming from scipy.stats
-            ax = self.df.plot(
+            ax = mapclassify_df.plot(
                 column="pop_est", scheme="QUANTILES", k=3, cmap="OrRd", legend=True
             )
         labels = [t.get_text() for t in ax.get_legend().get_texts()]
@@ -1090,8 +1135,8 @@ class TestMapclassifyPlotting:
         ]
         assert labels == expected
 
-    def test_bin_labels(self):
-        ax = self.df.plot(
+    def test_bin_labels(self, mapclassify_df):
+        ax = mapclassify_df.plot(
             column="pop_est",
             scheme="QUANTILES",
             k=3,
@@ -1103,9 +1148,9 @@ class TestMapclassifyPlotting:
         expected = ["foo", "bar", "baz"]
         assert labels == expected
 
-    def test_invalid_labels_length(self):
+    def test_invalid_labels_length(self, mapclassify_df):
         with pytest.raises(ValueError):
-            self.df.plot(
+            mapclassify_df.plot(
                 column="pop_est",
                 scheme="QUANTILES",
                 k=3,
@@ -1114,16 +1159,16 @@ class TestMapclassifyPlotting:
                 legend_kwds={"labels": ["foo", "bar"]},
             )
 
-    def test_negative_legend(self):
-        ax = self.df.plot(
+    def test_negative_legend(self, mapclassify_df):
+        ax = mapclassify_df.plot(
             column="NEGATIVES", scheme="FISHER_JENKS", k=3, cmap="OrRd", legend=True
         )
         labels = [t.get_text() for t in ax.get_legend().get_texts()]
         expected = [u"-10.00,  -3.41", u" -3.41,   3.30", u"  3.30,  10.00"]
         assert labels == expected
 
-    def test_fmt(self):
-        ax = self.df.plot(
+    def test_fmt(self, mapclassify_df):
+        ax = mapclassify_df.plot(
             column="NEGATIVES",
             scheme="FISHER_JENKS",
             k=3,
@@ -1135,8 +1180,8 @@ class TestMapclassifyPlotting:
         expected = [u"-10,  -3", u" -3,   3", u"  3,  10"]
         assert labels == expected
 
-    def test_interval(self):
-        ax = self.df.plot(
+    def test_interval(self, mapclassify_df):
+        ax = mapclassify_df.plot(
             column="NEGATIVES",
             scheme="FISHER_JENKS",
             k=3,
@@ -1149,17 +1194,21 @@ class TestMapclassifyPlotting:
         assert labels == expected
 
     @pytest.mark.parametrize("scheme", ["FISHER_JENKS", "FISHERJENKS"])
-    def test_scheme_name_compat(self, scheme):
-        ax = self.df.plot(column="NEGATIVES", scheme=scheme, k=3, legend=True)
+    def test_scheme_name_compat(self, scheme, mapclassify_df):
+        ax = mapclassify_df.plot(column="NEGATIVES", scheme=scheme, k=3, legend=True)
         assert len(ax.get_legend().get_texts()) == 3
 
-    def test_schemes(self):
+    def test_schemes(self, mapclassify_df):
         # test if all available classifiers pass
-        for scheme in self.classifiers:
-            self.df.plot(column="pop_est", scheme=scheme, legend=True)
+        import mapclassify
 
-    def test_classification_kwds(self):
-        ax = self.df.plot(
+        classifiers = list(mapclassify.classifiers.CLASSIFIERS)
+        classifiers.remove("UserDefined")
+        for scheme in classifiers:
+            mapclassify_df.plot(column="pop_est", scheme=scheme, legend=True)
+
+    def test_classification_kwds(self, mapclassify_df):
+        ax = mapclassify_df.plot(
             column="pop_est",
             scheme="percentiles",
             k=3,
@@ -1171,14 +1220,14 @@ class TestMapclassifyPlotting:
         expected = ["       140.00,    9961396.00", "   9961396.00, 1379302771.00"]
         assert labels == expected
 
-    def test_invalid_scheme(self):
+    def test_invalid_scheme(self, mapclassify_df):
         with pytest.raises(ValueError):
             scheme = "invalid_scheme_*#&)(*#"
-            self.df.plot(
+            mapclassify_df.plot(
                 column="gdp_md_est", scheme=scheme, k=3, cmap="OrRd", legend=True
             )
 
-    def test_cax_legend_passing(self):
+    def test_cax_legend_passing(self, mapclassify_df):
         """Pass a 'cax' argument to 'df.plot(.)', that is valid only if 'ax' is
         passed as well (if not, a new figure is created ad hoc, and 'cax' is
         ignored)
@@ -1189,15 +1238,17 @@ class TestMapclassifyPlotting:
         divider = make_axes_locatable(ax)
         cax = divider.append_axes("right", size="5%", pad=0.1)
         with pytest.raises(ValueError):
-            ax = self.df.plot(column="pop_est", cmap="OrRd", legend=True, cax=cax)
+            ax = mapclassify_df.plot(
+                column="pop_est", cmap="OrRd", legend=True, cax=cax
+            )
 
-    def test_cax_legend_height(self):
+    def test_cax_legend_height(self, mapclassify_df):
         """Pass a cax argument to 'df.plot(.)', the legend location must be
         aligned with those of main plot
         """
         # base case
         with warnings.catch_warnings(record=True) as _:  # don't print warning
-            ax = self.df.plot(column="pop_est", cmap="OrRd", legend=True)
+            ax = mapclassify_df.plot(column="pop_est", cmap="OrRd", legend=True)
         plot_height = _get_ax(ax.get_figure(), "").get_position().height
         legend_height = _get_ax(ax.get_figure(), "<colorbar>").get_position().height
         assert abs(plot_height - legend_height) >= 1e-6
@@ -1208,16 +1259,16 @@ class TestMapclassifyPlotting:
         divider = make_axes_locatable(ax2)
         cax = divider.append_axes("right", size="5%", pad=0.1, label="fixed_colorbar")
         with warnings.catch_warnings(record=True) as _:
-            ax2 = self.df.plot(
+            ax2 = mapclassify_df.plot(
                 column="pop_est", cmap="OrRd", legend=True, cax=cax, ax=ax2
             )
         plot_height = _get_ax(fig, "").get_position().height
         legend_height = _get_ax(fig, "fixed_colorbar").get_position().height
         assert abs(plot_height - legend_height) < 1e-6
 
-    def test_empty_bins(self):
+    def test_empty_bins(self, mapclassify_df):
         bins = np.arange(1, 11) / 10
-        ax = self.df.plot(
+        ax = mapclassify_df.plot(
             "low_vals",
             scheme="UserDefined",
             classification_kwds={"bins": bins},
@@ -1268,7 +1319,7 @@ class TestMapclassifyPlotting:
             line.get_markerfacecolor() for line in ax.get_legend().get_lines()
         ] == legend_colors_exp
 
-        ax2 = self.df.plot(
+        ax2 = mapclassify_df.plot(
             "mid_vals",
             scheme="UserDefined",
             classification_kwds={"bins": bins},
@@ -1308,7 +1359,7 @@ class TestMapclassifyPlotting:
             line.get_markerfacecolor() for line in ax2.get_legend().get_lines()
         ] == legend_colors_exp
 
-        ax3 = self.df.plot(
+        ax3 = mapclassify_df.plot(
             "high_vals",
             scheme="UserDefined",
             classification_kwds={"bins": bins},
@@ -1335,8 +1386,8 @@ class TestMapclassifyPlotting:
             line.get_markerfacecolor() for line in ax3.get_legend().get_lines()
         ] == legend_colors_exp
 
-    def test_equally_formatted_bins(self):
-        ax = self.nybb.plot(
+    def test_equally_formatted_bins(self, mapclassify_nybb):
+        ax = mapclassify_nybb.plot(
             "vals",
             scheme="quantiles",
             legend=True,
@@ -1351,7 +1402,7 @@ class TestMapclassifyPlotting:
         ]
         assert labels == expected
 
-        ax2 = self.nybb.plot(
+        ax2 = mapclassify_nybb.plot(
             "vals", scheme="quantiles", legend=True, legend_kwds=dict(fmt="{:.3f}")
         )
         labels = [t.get_text() for t in ax2.get_legend().get_texts()]
@@ -1365,26 +1416,34 @@ class TestMapclassifyPlotting:
         assert labels == expected
 
 
+@pytest.fixture(scope="class")
+def plot_collections_ax():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
 class TestPlotCollections:
-    def setup_method(self):
-        self.N = 3
-        self.values = np.arange(self.N)
-        self.points = GeoSeries(Point(i, i) for i in range(self.N))
-        self.lines = GeoSeries(
-            [LineString([(0, i), (4, i + 0.5), (9, i)]) for i in range(self.N)]
+    @classmethod
+    def setup_class(cls):
+        cls.N = 3
+        cls.values = np.arange(cls.N)
+        cls.points = GeoSeries(points_from_xy(cls.values, cls.values))
+        cls.lines = GeoSeries(
+            [LineString([(0, i), (4, i + 0.5), (9, i)]) for i in range(cls.N)]
         )
-        self.polygons = GeoSeries(
-            [Polygon([(0, i), (4, i + 0.5), (9, i)]) for i in range(self.N)]
+        cls.polygons = GeoSeries(
+            [Polygon([(0, i), (4, i + 0.5), (9, i)]) for i in range(cls.N)]
         )
+        cls.expected_linear = _cmap()(np.arange(cls.N) / (cls.N - 1))
+        cls.expected_rdbu = _cmap("RdBu")(np.arange(cls.N) / (cls.N - 1))
 
-    def test_points(self):
-        # failing with matplotlib 1.4.3 (edge stays black even when specified)
-        pytest.importorskip("matplotlib", "1.5.0")
-
+    def test_points(self, plot_collections_ax):
         from geopandas.plotting import _plot_point_collection, plot_point_collection
         from matplotlib.collections import PathCollection
 
-        fig, ax = plt.subplots()
+        ax = plot_collections_ax
+        ax.cla()
         coll = _plot_point_collection(ax, self.points)
         assert isinstance(coll, PathCollection)
         ax.cla()
@@ -1439,27 +1498,28 @@ class TestPlotCollections:
         with pytest.warns(DeprecationWarning):
             plot_point_collection(ax, self.points)
 
-    def test_points_values(self):
+    def test_points_values(self, plot_collections_ax):
         from geopandas.plotting import _plot_point_collection
 
         # default colormap
-        fig, ax = plt.subplots()
+        ax = plot_collections_ax
+        ax.cla()
         coll = _plot_point_collection(ax, self.points, self.values)
-        fig.canvas.draw_idle()
-        cmap = plt.get_cmap()
-        expected_colors = cmap(np.arange(self.N) / (self.N - 1))
+        ax.figure.canvas.draw_idle()
+        expected_colors = self.expected_linear
         _check_colors(self.N, coll.get_facecolors(), expected_colors)
         # edgecolor depends on matplotlib version
         # _check_colors(self.N, coll.get_edgecolors(), expected_colors)
 
-    def test_linestrings(self):
+    def test_linestrings(self, plot_collections_ax):
         from geopandas.plotting import (
             _plot_linestring_collection,
             plot_linestring_collection,
         )
         from matplotlib.collections import LineCollection
 
-        fig, ax = plt.subplots()
+        ax = plot_collections_ax
+        ax.cla()
         coll = _plot_linestring_collection(ax, self.lines)
         assert isinstance(coll, LineCollection)
         ax.cla()
@@ -1512,40 +1572,40 @@ class TestPlotCollections:
         with pytest.warns(DeprecationWarning):
             plot_linestring_collection(ax, self.lines)
 
-    def test_linestrings_values(self):
+    def test_linestrings_values(self, plot_collections_ax):
         from geopandas.plotting import _plot_linestring_collection
 
-        fig, ax = plt.subplots()
+        ax = plot_collections_ax
+        ax.cla()
 
         # default colormap
         coll = _plot_linestring_collection(ax, self.lines, self.values)
-        fig.canvas.draw_idle()
-        cmap = plt.get_cmap()
-        expected_colors = cmap(np.arange(self.N) / (self.N - 1))
+        ax.figure.canvas.draw_idle()
+        expected_colors = self.expected_linear
         _check_colors(self.N, coll.get_color(), expected_colors)
         ax.cla()
 
         # specify colormap
         coll = _plot_linestring_collection(ax, self.lines, self.values, cmap="RdBu")
-        fig.canvas.draw_idle()
-        cmap = plt.get_cmap("RdBu")
-        expected_colors = cmap(np.arange(self.N) / (self.N - 1))
+        ax.figure.canvas.draw_idle()
+        expected_colors = self.expected_rdbu
         _check_colors(self.N, coll.get_color(), expected_colors)
         ax.cla()
 
         # specify vmin/vmax
         coll = _plot_linestring_collection(ax, self.lines, self.values, vmin=3, vmax=5)
-        fig.canvas.draw_idle()
-        cmap = plt.get_cmap()
+        ax.figure.canvas.draw_idle()
+        cmap = _cmap()
         expected_colors = [cmap(0)]
         _check_colors(self.N, coll.get_color(), expected_colors * 3)
         ax.cla()
 
-    def test_polygons(self):
+    def test_polygons(self, plot_collections_ax):
         from geopandas.plotting import _plot_polygon_collection, plot_polygon_collection
         from matplotlib.collections import PatchCollection
 
-        fig, ax = plt.subplots()
+        ax = plot_collections_ax
+        ax.cla()
         coll = _plot_polygon_collection(ax, self.polygons)
         assert isinstance(coll, PatchCollection)
         ax.cla()
@@ -1604,16 +1664,16 @@ class TestPlotCollections:
         with pytest.warns(DeprecationWarning):
             plot_polygon_collection(ax, self.polygons)
 
-    def test_polygons_values(self):
+    def test_polygons_values(self, plot_collections_ax):
         from geopandas.plotting import _plot_polygon_collection
 
-        fig, ax = plt.subplots()
+        ax = plot_collections_ax
+        ax.cla()
 
         # default colormap, edge is still black by default
         coll = _plot_polygon_collection(ax, self.polygons, self.values)
-        fig.canvas.draw_idle()
-        cmap = plt.get_cmap()
-        exp_colors = cmap(np.arange(self.N) / (self.N - 1))
+        ax.figure.canvas.draw_idle()
+        exp_colors = self.expected_linear
         _check_colors(self.N, coll.get_facecolor(), exp_colors)
         # edgecolor depends on matplotlib version
         # _check_colors(self.N, coll.get_edgecolor(), ['k'] * self.N)
@@ -1621,25 +1681,23 @@ class TestPlotCollections:
 
         # specify colormap
         coll = _plot_polygon_collection(ax, self.polygons, self.values, cmap="RdBu")
-        fig.canvas.draw_idle()
-        cmap = plt.get_cmap("RdBu")
-        exp_colors = cmap(np.arange(self.N) / (self.N - 1))
+        ax.figure.canvas.draw_idle()
+        exp_colors = self.expected_rdbu
         _check_colors(self.N, coll.get_facecolor(), exp_colors)
         ax.cla()
 
         # specify vmin/vmax
         coll = _plot_polygon_collection(ax, self.polygons, self.values, vmin=3, vmax=5)
-        fig.canvas.draw_idle()
-        cmap = plt.get_cmap()
+        ax.figure.canvas.draw_idle()
+        cmap = _cmap()
         exp_colors = [cmap(0)]
         _check_colors(self.N, coll.get_facecolor(), exp_colors * 3)
         ax.cla()
 
         # override edgecolor
         coll = _plot_polygon_collection(ax, self.polygons, self.values, edgecolor="g")
-        fig.canvas.draw_idle()
-        cmap = plt.get_cmap()
-        exp_colors = cmap(np.arange(self.N) / (self.N - 1))
+        ax.figure.canvas.draw_idle()
+        exp_colors = self.expected_linear
         _check_colors(self.N, coll.get_facecolor(), exp_colors)
         _check_colors(self.N, coll.get_edgecolor(), ["g"] * self.N)
         ax.cla()
@@ -1790,28 +1848,50 @@ def _check_colors(N, actual_colors, expected_colors, alpha=None):
     collection : matplotlib.collections.Collection
         The colors of this collection's patches are read from
         `collection.get_facecolors()`
-    expected_colors : sequence of RGBA tuples
+    expected_colors : sequence of colors or numpy.ndarray
+        Color names, RGB(A) sequences, or a (K, 4) float array of RGBA
+        values (e.g. the output of a colormap).
     alpha : float (optional)
         If set, this alpha transparency will be applied to the
         `expected_colors`. (Any transparency on the `collection` is assumed
         to be set in its own facecolor RGBA tuples.)
     """
-    import matplotlib.colors as colors
-
-    conv = colors.colorConverter
-
-    # Convert 2D numpy array to a list of RGBA tuples.
-    actual_colors = map(tuple, actual_colors)
-    all_actual_colors = list(itertools.islice(itertools.cycle(actual_colors), N))
+    actual_colors = np.asarray(actual_colors, dtype=float).reshape(-1, 4)
+    # the colors cycle to meet the number of geometries
+    reps = -(-N // max(len(actual_colors), 1))
+    all_actual_colors = np.tile(actual_colors, (reps, 1))[:N]
 
     assert len(all_actual_colors) == len(expected_colors), (
         "Different " "lengths of actual and expected colors!"
     )
 
-    for actual, expected in zip(all_actual_colors, expected_colors):
-        assert actual == conv.to_rgba(expected, alpha=alpha), "{} != {}".format(
-            actual, conv.to_rgba(expected, alpha=alpha)
-        )
+    if (
+        isinstance(expected_colors, np.ndarray)
+        and expected_colors.ndim == 2
+        and expected_colors.shape[1] == 4
+        and expected_colors.dtype.kind == "f"
+    ):
+        # already an RGBA array (e.g. the output of a colormap)
+        expected = expected_colors
+        if alpha is not None:
+            expected = expected.copy()
+            expected[:, 3] = alpha
+    else:
+        expected = np.array(
+            [
+                # RGB(A) sequences (e.g. rows of a colormap array) must be hashable
+                _to_rgba(c if isinstance(c, str) else tuple(c), alpha)
+                for c in expected_colors
+            ],
+            dtype=float,
+        ).reshape(-1, 4)
+    np.testing.assert_array_almost_equal(all_actual_colors, expected)
+
+
+@functools.lru_cache(maxsize=256)
+def _to_rgba(color, alpha=None):
+    """Cached version of ``colorConverter.to_rgba``."""
+    return matplotlib.colors.colorConverter.to_rgba(color, alpha=alpha)
 
 
 def _style_to_linestring_onoffseq(linestyle, linewidth):
@@ -1820,8 +1900,27 @@ def _style_to_linestring_onoffseq(linestyle, linewidth):
     documented in `Collections.set_linestyle`,
     to the form `onoffseq`.
     """
+    offset, dashes = _scaled_dash_pattern(linestyle, linewidth)
+    # return a new list, so callers cannot modify the cached pattern
+    return offset, list(dashes) if dashes is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _scaled_dash_pattern(linestyle, linewidth):
+    """Cached dash pattern for `_style_to_linestring_onoffseq`, as a tuple."""
     offset, dashes = matplotlib.lines._get_dash_pattern(linestyle)
-    return matplotlib.lines._scale_dashes(offset, dashes, linewidth)
+    offset, dashes = matplotlib.lines._scale_dashes(offset, dashes, linewidth)
+    return offset, tuple(dashes) if dashes is not None else None
+
+
+@functools.lru_cache(maxsize=32)
+def _cmap(name=None, lut=None):
+    """Cached version of ``plt.get_cmap``.
+
+    The returned colormap is shared between all tests and must not be modified
+    (e.g. with ``set_bad``, ``set_under`` or ``set_over``).
+    """
+    return plt.get_cmap(name, lut)
 
 
 def _style_to_vertices(markerstyle):